@@ -1,5 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from .managers import groups_prefetch
 from .models import User, PasswordResetRequest
 
 
@@ -15,6 +16,9 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('supervisor', 'worksite').prefetch_related(groups_prefetch())
+    
     def get_role_name(self, obj):
         return obj.get_role_name()
     get_role_name.short_description = 'Role'
@@ -23,6 +27,7 @@ class UserAdmin(BaseUserAdmin):
 @admin.register(PasswordResetRequest)
 class PasswordResetRequestAdmin(admin.ModelAdmin):
     list_display = ['user', 'supervisor', 'status', 'created_at', 'processed_at']
+    list_select_related = ['user', 'supervisor']
     list_filter = ['status', 'created_at']
     search_fields = ['user__username', 'supervisor__username']
     readonly_fields = ['created_at', 'processed_at']
@@ -1,8 +1,17 @@
-from django.contrib.auth.models import BaseUserManager
+from django.contrib.auth.models import BaseUserManager, Group
+from django.db.models import Prefetch
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 
 
+def groups_prefetch():
+    """
+    Prefetch for a user queryset's groups, loading only the group names.
+    get_role_name() orders the groups itself, so the query is left unordered.
+    """
+    return Prefetch('groups', queryset=Group.objects.only('name'))
+
+
 class UserManager(BaseUserManager):
     """
     Custom user model manager for User model.
@@ -60,6 +69,13 @@ class UserManager(BaseUserManager):
 
         return self.create_user(username, password, **extra_fields)
     
+    def with_groups(self):
+        """
+        Prefetch each user's groups (name only) in one extra query, so list
+        views calling get_role_name() or serializing groups avoid N+1 queries.
+        """
+        return self.prefetch_related(groups_prefetch())
+    
     def active_users(self):
         """
         Return active users (not soft deleted).
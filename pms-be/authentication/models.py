@@ -68,13 +68,40 @@ class User(AbstractUser):
     def get_hierarchy_chain(self):
         """Get the full supervisor chain from this user up to CEO"""
         chain = [self]
-        visited = {self.id}
-        current = self.supervisor
+        if not self.supervisor_id:
+            return chain
+
+        # Fetch every supervisor above this user in a single recursive query.
+        # UNION (not UNION ALL) stops the recursion if the data contains a cycle.
+        table = self._meta.db_table
+        supervisors = {
+            user.id: user
+            for user in self.__class__.objects.raw(
+                f"""
+                WITH RECURSIVE chain (id, supervisor_id) AS (
+                    SELECT id, supervisor_id FROM {table} WHERE id = %s
+                    UNION
+                    SELECT u.id, u.supervisor_id FROM {table} u
+                    JOIN chain c ON u.id = c.supervisor_id
+                )
+                SELECT u.* FROM {table} u JOIN chain c ON u.id = c.id
+                """,
+                [self.supervisor_id],
+            )
+        }
 
+        # Order the chain by walking supervisor links in memory
+        visited = {self.id}
+        current = supervisors.get(self.supervisor_id)
         while current and current.id not in visited:
             chain.append(current)
             visited.add(current.id)
-            current = current.supervisor
+            current = supervisors.get(current.supervisor_id)
+
+        # Cache each fetched supervisor on its report so walking .supervisor
+        # along the chain doesn't hit the database again
+        for report, supervisor in zip(chain[1:], chain[2:]):
+            report.supervisor = supervisor
 
         return chain
 
@@ -191,6 +218,19 @@ class User(AbstractUser):
             'is_admin': self.is_superuser,
             'subordinate_count': self.direct_reports.filter(deleted_at__isnull=True).count(),
         }
+
+    def get_role_name(self) -> str:
+        """
+        Return the name of the user's first group, or '' if the user has none.
+
+        Reads through groups.all() so a prefetched cache (see
+        User.objects.with_groups()) is used instead of a query per user. The
+        result is kept on the instance until its groups change.
+        """
+        if not hasattr(self, '_role_name_cache'):
+            groups = sorted(self.groups.all(), key=lambda group: group.pk)
+            self._role_name_cache = groups[0].name if groups else ''
+        return self._role_name_cache
     
     def __str__(self):
         return self.get_full_name()
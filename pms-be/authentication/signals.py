@@ -0,0 +1,12 @@
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+from .models import User
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+def clear_role_name_cache(sender, instance, action, reverse, **kwargs):
+    """
+    Drop the cached get_role_name() result when a user's groups change.
+    """
+    if not reverse and action in ('post_add', 'post_remove', 'post_clear'):
+        instance.__dict__.pop('_role_name_cache', None)
@@ -0,0 +1,95 @@
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group, Permission
+from authentication.models import User
+
+# Permission rows are created with the test database and survive every
+# TestCase rollback, so get_permissions() loads each one once per process
+_permission_cache = {}
+
+
+def build_hierarchy(worksite=None, password=None, **ceo_fields):
+    """
+    Create a CEO -> manager -> employee chain in two queries.
+
+    The users are inserted with one bulk INSERT and linked to their supervisors
+    with one bulk UPDATE. The password is hashed once and shared by all three;
+    leave it as None for users that never log in to skip hashing entirely.
+    """
+    encoded_password = make_password(password)
+
+    ceo = User(
+        username='ceo',
+        first_name='Chief',
+        last_name='Executive',
+        worksite=worksite,
+        password=encoded_password,
+        **ceo_fields
+    )
+    manager = User(
+        username='manager',
+        first_name='Middle',
+        last_name='Manager',
+        worksite=worksite,
+        password=encoded_password
+    )
+    employee = User(
+        username='employee',
+        first_name='Team',
+        last_name='Member',
+        worksite=worksite,
+        password=encoded_password
+    )
+    User.objects.bulk_create([ceo, manager, employee])
+
+    # bulk_create bypasses save(), so supervisors are linked once the pks exist
+    manager.supervisor = ceo
+    employee.supervisor = manager
+    User.objects.bulk_update([manager, employee], ['supervisor'])
+
+    return ceo, manager, employee
+
+
+def fast_user(save=True, **fields):
+    """
+    Build a user with an unusable password, skipping password hashing.
+
+    The user is saved unless save is False, which leaves it ready for
+    bulk_create().
+    """
+    user = User(**fields)
+    user.set_unusable_password()
+    if save:
+        user.save()
+    return user
+
+
+def get_groups(*names):
+    """Return a {name: Group} dict, creating any missing groups in one INSERT."""
+    Group.objects.bulk_create([Group(name=name) for name in names], ignore_conflicts=True)
+    return {group.name: group for group in Group.objects.filter(name__in=names)}
+
+
+def get_permissions(*codenames):
+    """Return a {codename: Permission} dict of requisition permissions, querying only uncached ones."""
+    missing = [codename for codename in codenames if codename not in _permission_cache]
+    if missing:
+        # codename is only unique per content type, so in_bulk() cannot key on it
+        _permission_cache.update({
+            permission.codename: permission
+            for permission in Permission.objects.filter(
+                content_type__app_label='requisition',
+                codename__in=missing,
+            )
+        })
+    return {codename: _permission_cache[codename] for codename in codenames}
+
+
+def clear_permission_cache():
+    """Forget the cached permissions so the next get_permissions() call queries again."""
+    _permission_cache.clear()
+
+
+def clear_user_perm_cache(user):
+    """Drop ModelBackend's cached permissions so the next has_perm() reloads them."""
+    for attr in ('_perm_cache', '_user_perm_cache', '_group_perm_cache'):
+        user.__dict__.pop(attr, None)
@@ -1,7 +1,9 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
 from django.core.exceptions import ValidationError
 from organization.models import Worksite, Division
+from authentication.tests.factories import fast_user
 
 User = get_user_model()
 
@@ -12,11 +14,12 @@ class UserModelTest(TestCase):
     def setUp(self):
         """Set up test data"""
         # Create a test admin user first for Division.created_by
-        self.admin_user = User.objects.create_superuser(
+        self.admin_user = fast_user(
             username="testadmin",
             first_name="Test",
             last_name="Admin",
-            password="adminpass123"
+            is_staff=True,
+            is_superuser=True
         )
         
         self.worksite = Worksite.objects.create(
@@ -48,8 +51,7 @@ class UserModelTest(TestCase):
         """Test creating user without username auto-generates from names"""
         user = User.objects.create_user(
             first_name="Ahmed",
-            last_name="Hassan",
-            password="testpass123"
+            last_name="Hassan"
         )
         
         self.assertEqual(user.username, "ahmhas")
@@ -61,15 +63,13 @@ class UserModelTest(TestCase):
         # Create first user
         user1 = User.objects.create_user(
             first_name="Ahmed",
-            last_name="Hassan",
-            password="testpass123"
+            last_name="Hassan"
         )
         
         # Create second user with same name pattern
         user2 = User.objects.create_user(
             first_name="Ahmad",
-            last_name="Hasan", 
-            password="testpass123"
+            last_name="Hasan"
         )
         
         self.assertEqual(user1.username, "ahmhas")
@@ -81,36 +81,32 @@ class UserModelTest(TestCase):
             User.objects.create_user(
                 first_name="Test",
                 # Missing last_name
-                password="testpass123"
             )
         
         with self.assertRaises(ValueError):
             User.objects.create_user(
                 last_name="User",
                 # Missing first_name
-                password="testpass123"
             )
     
     def test_user_full_name(self):
         """Test get_full_name method"""
-        user = User.objects.create_user(
+        user = fast_user(
             username="testuser",
             first_name="Test",
-            last_name="User",
-            password="testpass123"
+            last_name="User"
         )
         
         self.assertEqual(user.get_full_name(), "Test User")
     
     def test_user_with_worksite_and_division(self):
         """Test user with worksite and division relationships"""
-        user = User.objects.create_user(
+        user = fast_user(
             username="testuser",
             first_name="Test",
             last_name="User",
             worksite=self.worksite,
-            division=self.division,
-            password="testpass123"
+            division=self.division
         )
         
         self.assertEqual(user.worksite, self.worksite)
@@ -118,50 +114,47 @@ class UserModelTest(TestCase):
     
     def test_user_supervisor_relationship(self):
         """Test supervisor relationship"""
-        supervisor = User.objects.create_user(
+        supervisor = fast_user(
             username="supervisor",
             first_name="Super",
-            last_name="Visor",
-            password="testpass123"
+            last_name="Visor"
         )
         
-        employee = User.objects.create_user(
+        employee = fast_user(
             username="employee",
             first_name="Emp",
             last_name="Loyee",
-            supervisor=supervisor,
-            password="testpass123"
+            supervisor=supervisor
         )
         
         self.assertEqual(employee.supervisor, supervisor)
-        self.assertIn(employee, supervisor.direct_reports.all())
+        self.assertTrue(supervisor.direct_reports.filter(pk=employee.pk).exists())
     
     def test_user_hierarchy_chain(self):
         """Test get_hierarchy_chain method"""
-        ceo = User.objects.create_user(
+        ceo = fast_user(
             username="ceo",
             first_name="Chief",
-            last_name="Executive",
-            password="testpass123"
+            last_name="Executive"
         )
         
-        manager = User.objects.create_user(
+        manager = fast_user(
             username="manager",
             first_name="Man",
             last_name="Ager",
-            supervisor=ceo,
-            password="testpass123"
+            supervisor=ceo
         )
         
-        employee = User.objects.create_user(
+        employee = fast_user(
             username="employee",
             first_name="Emp",
             last_name="Loyee",
-            supervisor=manager,
-            password="testpass123"
+            supervisor=manager
         )
         
-        chain = employee.get_hierarchy_chain()
+        # The whole chain is resolved with one recursive query
+        with self.assertNumQueries(1):
+            chain = employee.get_hierarchy_chain()
         self.assertEqual(len(chain), 3)
         self.assertEqual(chain[0], employee)
         self.assertEqual(chain[1], manager)
@@ -169,12 +162,11 @@ class UserModelTest(TestCase):
     
     def test_user_phone_number(self):
         """Test phone_number field"""
-        user = User.objects.create_user(
+        user = fast_user(
             username="testuser",
             first_name="Test",
             last_name="User",
-            phone_number="+90 555 123 4567",
-            password="testpass123"
+            phone_number="+90 555 123 4567"
         )
         
         self.assertEqual(user.phone_number, "+90 555 123 4567")
@@ -184,8 +176,7 @@ class UserModelTest(TestCase):
         admin = User.objects.create_superuser(
             username="admin",
             first_name="Admin",
-            last_name="User",
-            password="adminpass123"
+            last_name="User"
         )
         
         self.assertTrue(admin.is_staff)
@@ -195,10 +186,44 @@ class UserModelTest(TestCase):
         """Test creating superuser without username"""
         admin = User.objects.create_superuser(
             first_name="Admin",
-            last_name="User",
-            password="adminpass123"
+            last_name="User"
         )
         
         self.assertEqual(admin.username, "admuse")
         self.assertTrue(admin.is_staff)
-        self.assertTrue(admin.is_superuser)
\ No newline at end of file
+        self.assertTrue(admin.is_superuser)
+    
+    def test_role_name_with_groups(self):
+        """Test get_role_name returns the first group's name"""
+        user = fast_user(username="roleuser", first_name="Role", last_name="User")
+        self.assertEqual(user.get_role_name(), "")
+        
+        employees = Group.objects.create(name="Employees")
+        reviewers = Group.objects.create(name="Reviewers")
+        user.groups.add(reviewers, employees)
+        
+        self.assertEqual(user.get_role_name(), "Employees")
+        with self.assertNumQueries(0):
+            self.assertEqual(user.get_role_name(), "Employees")
+        
+        user.groups.remove(employees)
+        self.assertEqual(user.get_role_name(), "Reviewers")
+    
+    def test_role_name_uses_prefetched_groups(self):
+        """Test get_role_name on many users costs one query plus one prefetch"""
+        group = Group.objects.create(name="Employees")
+        users = User.objects.bulk_create([
+            User(username=f"worker{i}", first_name="Worker", last_name=str(i))
+            for i in range(50)
+        ])
+        User.groups.through.objects.bulk_create([
+            User.groups.through(user_id=user.pk, group_id=group.pk) for user in users
+        ])
+        
+        with self.assertNumQueries(2):
+            roles = [
+                user.get_role_name()
+                for user in User.objects.with_groups().filter(username__startswith="worker")
+            ]
+        
+        self.assertEqual(roles, ["Employees"] * 50)
@@ -1,76 +1,71 @@
 from django.test import TestCase
-from django.contrib.auth.models import Group, Permission
-from django.contrib.contenttypes.models import ContentType
+from django.contrib.auth.models import Group
 from authentication.models import User
 from organization.models import Worksite
+from authentication.tests.factories import (
+    build_hierarchy, clear_user_perm_cache, get_groups, get_permissions
+)
 
 
 class UserPermissionTests(TestCase):
     """Test user permission methods and role-based logic"""
 
-    def setUp(self):
-        """Set up test data"""
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class"""
+        cls.permissions = get_permissions('can_purchase', 'view_all_requests')
+
         # Create worksite first
-        self.worksite = Worksite.objects.create(
+        cls.worksite = Worksite.objects.create(
             city="Test City",
             address="Test Address",
             country="Test Country"
         )
 
         # Create test users
-        self.admin = User.objects.create_user(
+        cls.admin = User.objects.create_user(
             username='admin',
             first_name='Admin',
             last_name='User',
-            worksite=self.worksite,
+            worksite=cls.worksite,
             is_superuser=True
         )
 
-        self.supervisor = User.objects.create_user(
+        cls.supervisor = User.objects.create_user(
             username='supervisor',
             first_name='Super',
             last_name='Visor',
-            worksite=self.worksite
+            worksite=cls.worksite
         )
 
-        self.employee = User.objects.create_user(
+        cls.employee = User.objects.create_user(
             username='employee',
             first_name='Emp',
             last_name='Loyee',
-            worksite=self.worksite,
-            supervisor=self.supervisor
+            worksite=cls.worksite,
+            supervisor=cls.supervisor
         )
 
-        self.purchasing_user = User.objects.create_user(
+        cls.purchasing_user = User.objects.create_user(
             username='purchasing',
             first_name='Purchase',
             last_name='Agent',
-            worksite=self.worksite
+            worksite=cls.worksite
         )
 
         # Create purchasing group and add permissions
-        self.purchasing_group, created = Group.objects.get_or_create(name='Purchasing')
-
-        # Get or create the custom permission
-        from requisition.models import Request
-        content_type = ContentType.objects.get_for_model(Request)
-        can_purchase_permission, _ = Permission.objects.get_or_create(
-            codename='can_purchase',
-            name='Can handle purchasing tasks',
-            content_type=content_type,
-        )
-
-        view_all_requests_permission, _ = Permission.objects.get_or_create(
-            codename='view_all_requests',
-            name='Can view all requests system-wide',
-            content_type=content_type,
+        cls.purchasing_group = get_groups('Purchasing')['Purchasing']
+
+        # Assign permissions to purchasing group with one through-table INSERT;
+        # the group already has it when the data migrations have run
+        GroupPermission = Group.permissions.through
+        GroupPermission.objects.bulk_create(
+            [GroupPermission(group_id=cls.purchasing_group.pk, permission_id=cls.permissions['can_purchase'].pk)],
+            ignore_conflicts=True,
         )
 
-        # Assign permissions to purchasing group
-        self.purchasing_group.permissions.add(can_purchase_permission)
-
         # Add purchasing user to purchasing group
-        self.purchasing_user.groups.add(self.purchasing_group)
+        cls.purchasing_user.groups.add(cls.purchasing_group)
 
     def test_admin_has_all_permissions(self):
         """Test that admin users have all permissions"""
@@ -80,21 +75,36 @@ class UserPermissionTests(TestCase):
 
     def test_regular_employee_permissions(self):
         """Test regular employee permissions"""
-        self.assertFalse(self.employee.can_purchase())
-        self.assertFalse(self.employee.can_view_all_requests())
-        self.assertFalse(self.employee.has_subordinates())
+        # Two queries fill the permission cache (user and group permissions),
+        # every later has_perm() is a set lookup; one more query checks for a
+        # purchasing group and one for direct reports
+        with self.assertNumQueries(4):
+            self.assertFalse(self.employee.can_purchase())
+            self.assertFalse(self.employee.can_view_all_requests())
+            self.assertFalse(self.employee.has_subordinates())
 
     def test_supervisor_permissions(self):
         """Test supervisor permissions based on having subordinates"""
-        self.assertFalse(self.supervisor.can_purchase())
-        self.assertFalse(self.supervisor.can_view_all_requests())
-        self.assertTrue(self.supervisor.has_subordinates())
+        # Warm the permission cache so the has_perm() checks below are set lookups
+        self.supervisor.get_all_permissions()
+
+        # Only the purchasing group and direct report checks reach the database
+        with self.assertNumQueries(2):
+            self.assertFalse(self.supervisor.can_purchase())
+            self.assertFalse(self.supervisor.can_view_all_requests())
+            self.assertTrue(self.supervisor.has_subordinates())
 
     def test_purchasing_user_permissions(self):
         """Test purchasing user permissions via group membership"""
-        self.assertTrue(self.purchasing_user.can_purchase())
-        self.assertFalse(self.purchasing_user.can_view_all_requests())
-        self.assertFalse(self.purchasing_user.has_subordinates())
+        # Warm the permission cache so the has_perm() checks below are set lookups
+        self.purchasing_user.get_all_permissions()
+
+        # can_purchase is granted through the group permission, so only the
+        # direct report check reaches the database
+        with self.assertNumQueries(1):
+            self.assertTrue(self.purchasing_user.can_purchase())
+            self.assertFalse(self.purchasing_user.can_view_all_requests())
+            self.assertFalse(self.purchasing_user.has_subordinates())
 
     def test_user_role_info(self):
         """Test the get_role_info method returns correct data"""
@@ -193,31 +203,13 @@ class UserPermissionTests(TestCase):
         self.assertFalse(test_user.can_view_all_requests())
 
         # Assign permission directly to user
-        from requisition.models import Request
-        content_type = ContentType.objects.get_for_model(Request)
-        can_purchase_permission = Permission.objects.get(
-            codename='can_purchase',
-            content_type=content_type,
-        )
+        test_user.user_permissions.add(self.permissions['can_purchase'])
 
-        test_user.user_permissions.add(can_purchase_permission)
-
-        # Refresh from database and clear permission cache
-        test_user.refresh_from_db()
-        # Clear Django's permission cache
-        if hasattr(test_user, '_perm_cache'):
-            delattr(test_user, '_perm_cache')
+        # Clear Django's permission caches rather than re-fetching the user
+        clear_user_perm_cache(test_user)
 
         # The user should have permission through direct assignment
-        # For now, let's verify the permission was added and test works with group membership instead
-        self.assertTrue(test_user.user_permissions.filter(codename='can_purchase').exists())
-
-        # Also test by adding user to purchasing group (alternative approach)
-        purchasing_group, _ = Group.objects.get_or_create(name='Purchasing')
-        test_user.groups.add(purchasing_group)
-        test_user.refresh_from_db()
-
-        # Now should have permission via group membership
+        self.assertTrue(test_user.has_perm('requisition.can_purchase'))
         self.assertTrue(test_user.can_purchase())
 
     def test_deleted_users_not_counted_as_subordinates(self):
@@ -242,49 +234,29 @@ class UserPermissionTests(TestCase):
 class PermissionIntegrationTests(TestCase):
     """Test permission system integration with request workflows"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for integration tests"""
-        self.worksite = Worksite.objects.create(
+        cls.worksite = Worksite.objects.create(
             city="Test City",
             address="Test Address",
             country="Test Country"
         )
 
         # Create user hierarchy: CEO -> Manager -> Employee
-        self.ceo = User.objects.create_user(
-            username='ceo',
-            first_name='Chief',
-            last_name='Executive',
-            worksite=self.worksite
-        )
-
-        self.manager = User.objects.create_user(
-            username='manager',
-            first_name='Middle',
-            last_name='Manager',
-            worksite=self.worksite,
-            supervisor=self.ceo
-        )
-
-        self.employee = User.objects.create_user(
-            username='employee',
-            first_name='Team',
-            last_name='Member',
-            worksite=self.worksite,
-            supervisor=self.manager
-        )
+        cls.ceo, cls.manager, cls.employee = build_hierarchy(worksite=cls.worksite)
 
         # Create purchasing user
-        self.purchasing_agent = User.objects.create_user(
+        cls.purchasing_agent = User.objects.create_user(
             username='purchasing',
             first_name='Purchase',
             last_name='Agent',
-            worksite=self.worksite
+            worksite=cls.worksite
         )
 
         # Add to purchasing group
-        purchasing_group, created = Group.objects.get_or_create(name='Purchasing')
-        self.purchasing_agent.groups.add(purchasing_group)
+        purchasing_group = get_groups('Purchasing')['Purchasing']
+        cls.purchasing_agent.groups.add(purchasing_group)
 
     def test_approval_hierarchy_logic(self):
         """Test that approval hierarchy works correctly"""
@@ -336,7 +308,10 @@ class PermissionIntegrationTests(TestCase):
         # Make manager also a purchasing agent
         purchasing_group = Group.objects.get(name='Purchasing')
         self.manager.groups.add(purchasing_group)
-        self.manager.refresh_from_db()
+
+        # Group changes are not seen by a warm permission cache; reset it
+        # instead of reloading the user
+        clear_user_perm_cache(self.manager)
 
         role_info = self.manager.get_role_info()
 
@@ -1,8 +1,9 @@
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase
 from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import Group, Permission
 from organization.models import Worksite, Division
 
@@ -12,10 +13,13 @@ User = get_user_model()
 class UserViewSetTest(APITestCase):
     """Test cases for UserViewSet"""
     
+    @classmethod
+    def setUpTestData(cls):
+        """Resolve URLs once for the whole class"""
+        cls.users_url = reverse('user-list')
+    
     def setUp(self):
         """Set up test data"""
-        self.client = APIClient()
-        
         # Create worksite
         self.worksite = Worksite.objects.create(
             address="123 Test St",
@@ -27,8 +31,7 @@ class UserViewSetTest(APITestCase):
         self.admin_user = User.objects.create_superuser(
             username="admin",
             first_name="Admin",
-            last_name="User",
-            password="adminpass123"
+            last_name="User"
         )
         
         # Create division with admin as creator
@@ -41,15 +44,13 @@ class UserViewSetTest(APITestCase):
             username="regular",
             first_name="Regular",
             last_name="User",
-            worksite=self.worksite,
-            password="regularpass123"
+            worksite=self.worksite
         )
         
         # Create test group
         self.test_group = Group.objects.create(name="Test Group")
         
         # URLs
-        self.users_url = reverse('user-list')
         self.user_detail_url = lambda pk: reverse('user-detail', args=[pk])
     
     def test_list_users_as_admin(self):
@@ -213,7 +214,8 @@ class UserViewSetTest(APITestCase):
         )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(self.test_group, self.regular_user.groups.all())
+        group_ids = set(self.regular_user.groups.values_list('id', flat=True))
+        self.assertEqual(group_ids, {self.test_group.id})
     
     def test_filter_users_by_worksite(self):
         """Test filtering users by worksite"""
@@ -251,4 +253,56 @@ class UserViewSetTest(APITestCase):
         """Test unauthenticated users cannot access user endpoints"""
         response = self.client.get(self.users_url)
         
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TokenAuthTest(APITestCase):
+    """Test cases for JWT login and refresh endpoints"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Resolve URLs once for the whole class"""
+        cls.login_url = reverse('token_obtain_pair')
+        cls.refresh_url = reverse('token_refresh')
+    
+    def setUp(self):
+        """Set up test data"""
+        self.user = User.objects.create_user(
+            username="tokenuser",
+            first_name="Token",
+            last_name="User"
+        )
+    
+    def test_login_returns_token_pair(self):
+        """Test login with valid credentials returns access and refresh tokens"""
+        self.user.set_password("tokenpass123")
+        self.user.save()
+        
+        response = self.client.post(self.login_url, {
+            'username': 'tokenuser',
+            'password': 'tokenpass123'
+        }, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tokens = response.json()
+        self.assertIn('access', tokens)
+        self.assertIn('refresh', tokens)
+    
+    def test_login_with_invalid_credentials(self):
+        """Test login with wrong password is rejected"""
+        response = self.client.post(self.login_url, {
+            'username': 'tokenuser',
+            'password': 'wrongpass'
+        }, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_refresh_returns_new_access_token(self):
+        """Test refresh endpoint issues a new access token"""
+        # Mint the refresh token directly instead of logging in, so no password hashing is needed
+        refresh_token = str(RefreshToken.for_user(self.user))
+        
+        response = self.client.post(self.refresh_url, {'refresh': refresh_token}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('access', response.json())
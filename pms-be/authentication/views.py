@@ -39,17 +39,17 @@ class UserViewSet(viewsets.ModelViewSet):
 
         # Admins can see all users
         if user.has_perm('auth.view_user'):
-            return User.objects.filter(deleted_at__isnull=True)
+            return User.objects.with_groups().filter(deleted_at__isnull=True)
 
         # Supervisors can see themselves and their subordinates
         subordinates = user.get_all_subordinates()
         if subordinates:
             # Return self + subordinates
             subordinate_ids = [sub.id for sub in subordinates]
-            return User.objects.filter(id__in=[user.id] + subordinate_ids, deleted_at__isnull=True)
+            return User.objects.with_groups().filter(id__in=[user.id] + subordinate_ids, deleted_at__isnull=True)
 
         # Regular users can only see themselves
-        return User.objects.filter(id=user.id)
+        return User.objects.with_groups().filter(id=user.id)
     
     def get_permissions(self):
         # Special case for 'me' and 'my_permissions' actions - only need authentication
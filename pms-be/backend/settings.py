@@ -118,6 +118,22 @@ if 'test' in sys.argv or 'pytest' in sys.modules:
         'NAME': config('TEST_DB_NAME', default=':memory:'),
     }
 
+    class DisableMigrations:
+        """Build the test schema straight from the models instead of replaying migrations."""
+
+        def __contains__(self, item):
+            return True
+
+        def __getitem__(self, item):
+            return None
+
+    # Set TEST_RUN_MIGRATIONS=True to exercise the migration graph (and its data migrations)
+    if not config('TEST_RUN_MIGRATIONS', default=False, cast=bool):
+        MIGRATION_MODULES = DisableMigrations()
+
+    # Test users don't need a slow, secure hash; keeps create_user/set_password cheap
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -126,9 +126,10 @@ class DivisionModelTest(TestCase):
         
         division.worksites.add(self.worksite1, self.worksite2)
         
-        self.assertEqual(division.worksites.count(), 2)
-        self.assertIn(self.worksite1, division.worksites.all())
-        self.assertIn(self.worksite2, division.worksites.all())
+        worksites = list(division.worksites.all())
+        self.assertEqual(len(worksites), 2)
+        self.assertIn(self.worksite1, worksites)
+        self.assertIn(self.worksite2, worksites)
     
     def test_division_str_method(self):
         """Test division string representation"""
@@ -161,8 +162,8 @@ class DivisionModelTest(TestCase):
             created_by=self.creator_user
         )
         
-        created_divisions = self.creator_user.created_divisions.all()
-        self.assertEqual(created_divisions.count(), 2)
+        created_divisions = list(self.creator_user.created_divisions.all())
+        self.assertEqual(len(created_divisions), 2)
         self.assertIn(division1, created_divisions)
         self.assertIn(division2, created_divisions)
     
@@ -197,6 +198,7 @@ class DivisionModelTest(TestCase):
         self.assertEqual(division.worksites.count(), 2)
         
         division.worksites.remove(self.worksite1)
-        self.assertEqual(division.worksites.count(), 1)
-        self.assertNotIn(self.worksite1, division.worksites.all())
-        self.assertIn(self.worksite2, division.worksites.all())
\ No newline at end of file
+        worksites = list(division.worksites.all())
+        self.assertEqual(len(worksites), 1)
+        self.assertNotIn(self.worksite1, worksites)
+        self.assertIn(self.worksite2, worksites)
\ No newline at end of file
@@ -1,7 +1,7 @@
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase
 from rest_framework import status
 from organization.models import Worksite, Division
 
@@ -13,28 +13,23 @@ class WorksiteViewSetTest(APITestCase):
     
     def setUp(self):
         """Set up test data"""
-        self.client = APIClient()
-        
         # Create test users
         self.admin_user = User.objects.create_superuser(
             username="admin",
             first_name="Admin",
-            last_name="User",
-            password="adminpass123"
+            last_name="User"
         )
         
         self.regular_user = User.objects.create_user(
             username="regular",
             first_name="Regular", 
-            last_name="User",
-            password="regularpass123"
+            last_name="User"
         )
         
         self.chief_user = User.objects.create_user(
             username="chief",
             first_name="Chief",
-            last_name="User", 
-            password="chiefpass123"
+            last_name="User"
         )
         
         # Create test worksites
@@ -190,21 +185,17 @@ class DivisionViewSetTest(APITestCase):
     
     def setUp(self):
         """Set up test data"""
-        self.client = APIClient()
-        
         # Create test users
         self.admin_user = User.objects.create_superuser(
             username="admin",
             first_name="Admin",
-            last_name="User",
-            password="adminpass123"
+            last_name="User"
         )
         
         self.regular_user = User.objects.create_user(
             username="regular",
             first_name="Regular",
-            last_name="User",
-            password="regularpass123"
+            last_name="User"
         )
         
         # Create test worksite
@@ -5,6 +5,7 @@ from .models import Request, ApprovalHistory, AuditLog, RequestRevision, Request
 @admin.register(Request)
 class RequestAdmin(admin.ModelAdmin):
     list_display = ['request_number', 'item', 'created_by', 'status', 'quantity', 'unit', 'created_at']
+    list_select_related = ['created_by']
     list_filter = ['status', 'unit', 'category', 'created_at']
     search_fields = ['request_number', 'item', 'created_by__username']
     readonly_fields = ['request_number', 'created_at', 'updated_at']
@@ -28,6 +29,7 @@ class RequestAdmin(admin.ModelAdmin):
 @admin.register(ApprovalHistory)
 class ApprovalHistoryAdmin(admin.ModelAdmin):
     list_display = ['request', 'user', 'action', 'level', 'created_at']
+    list_select_related = ['request', 'user']
     list_filter = ['action', 'level', 'created_at']
     search_fields = ['request__request_number', 'user__username']
     readonly_fields = ['created_at']
@@ -36,6 +38,7 @@ class ApprovalHistoryAdmin(admin.ModelAdmin):
 @admin.register(RequestRevision)
 class RequestRevisionAdmin(admin.ModelAdmin):
     list_display = ['request', 'revision_number', 'requested_by', 'revised_by', 'created_at']
+    list_select_related = ['request', 'requested_by', 'revised_by']
     list_filter = ['revision_number', 'created_at']
     search_fields = ['request__request_number', 'requested_by__username']
     readonly_fields = ['created_at', 'revised_at']
@@ -44,6 +47,7 @@ class RequestRevisionAdmin(admin.ModelAdmin):
 @admin.register(AuditLog)
 class AuditLogAdmin(admin.ModelAdmin):
     list_display = ['user', 'table_name', 'action', 'record_id', 'timestamp']
+    list_select_related = ['user']
     list_filter = ['table_name', 'action', 'timestamp']
     search_fields = ['user__username', 'table_name']
     readonly_fields = ['timestamp']
@@ -52,6 +56,7 @@ class AuditLogAdmin(admin.ModelAdmin):
 @admin.register(RequestArchive)
 class RequestArchiveAdmin(admin.ModelAdmin):
     list_display = ['id', 'archive_date', 'period_start', 'period_end', 'request_count', 'file_size_mb', 'downloaded', 'downloaded_by']
+    list_select_related = ['downloaded_by']
     list_filter = ['downloaded', 'archive_date']
     search_fields = ['archived_request_numbers']
     readonly_fields = ['id', 'archive_date', 'file_path', 'file_size', 'request_count', 'archived_request_ids', 'archived_request_numbers', 'downloaded', 'downloaded_at', 'downloaded_by', 'created_at']
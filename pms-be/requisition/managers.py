@@ -0,0 +1,14 @@
+from django.db import models
+
+
+class RequestQuerySet(models.QuerySet):
+    """
+    Custom queryset for Request model.
+    """
+
+    def with_related(self):
+        """
+        Join the users read when serializing requests or resolving the next
+        approver, so listing requests doesn't issue a query per row.
+        """
+        return self.select_related('created_by__supervisor', 'last_approver__supervisor')
@@ -3,6 +3,7 @@ import uuid
 from datetime import datetime
 from django.utils import timezone
 from django.contrib.auth import get_user_model
+from .managers import RequestQuerySet
 
 
 class Request(models.Model):
@@ -29,6 +30,20 @@ class Request(models.Model):
         ('liter', 'Liters'),
     ]
 
+    # Allowed status changes, keyed by the current status
+    VALID_TRANSITIONS = {
+        'draft': ['pending'],
+        'pending': ['in_review', 'approved', 'rejected', 'revision_requested'],
+        'in_review': ['in_review', 'approved', 'rejected', 'revision_requested'],
+        'revision_requested': ['pending'],  # After revision, goes back to pending
+        'approved': ['purchasing', 'rejected'],  # Purchasing team can still reject
+        'purchasing': ['ordered', 'rejected', 'revision_requested'],  # Purchasing actions
+        'ordered': ['delivered'],
+        'delivered': ['completed'],
+        'rejected': [],  # Final state
+        'completed': [],  # Final state
+    }
+
     request_number = models.CharField(max_length=50, unique=True)
     item = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -52,18 +67,12 @@ class Request(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     submitted_at = models.DateTimeField(null=True, blank=True)
     
+    objects = RequestQuerySet.as_manager()
+    
     def get_approval_chain(self):
         """Get the full approval chain from creator's supervisor up"""
-        chain = []
-        visited = set()
-        current = self.created_by.supervisor
-
-        while current and current.id not in visited:
-            chain.append(current)
-            visited.add(current.id)
-            current = current.supervisor
-
-        return chain
+        # The creator's hierarchy chain starts with the creator themselves
+        return self.created_by.get_hierarchy_chain()[1:]
     
     def get_next_approver(self):
         """Get the next person in the approval chain based on last approver"""
@@ -89,28 +98,21 @@ class Request(models.Model):
         else:
             return f"Status: {self.get_status_display()}"
     
+    @classmethod
+    def is_valid_transition(cls, from_status, to_status):
+        """Check whether a status transition is allowed, without touching the database"""
+        return to_status in cls.VALID_TRANSITIONS.get(from_status, [])
+    
     def get_valid_transitions(self):
         """Get valid status transitions from current state"""
-        transitions = {
-            'draft': ['pending'],
-            'pending': ['in_review', 'approved', 'rejected', 'revision_requested'],
-            'in_review': ['in_review', 'approved', 'rejected', 'revision_requested'],
-            'revision_requested': ['pending'],  # After revision, goes back to pending
-            'approved': ['purchasing', 'rejected'],  # Purchasing team can still reject
-            'purchasing': ['ordered', 'rejected', 'revision_requested'],  # Purchasing actions
-            'ordered': ['delivered'],
-            'delivered': ['completed'],
-            'rejected': [],  # Final state
-            'completed': [],  # Final state
-        }
-        return transitions.get(self.status, [])
+        return list(self.VALID_TRANSITIONS.get(self.status, []))
     
     def can_transition_to(self, new_status):
         """Check if transition to new status is valid"""
-        return new_status in self.get_valid_transitions()
+        return self.is_valid_transition(self.status, new_status)
     
-    def transition_to(self, new_status, user, notes=""):
-        """Safely transition to new status with validation"""
+    def _apply_transition(self, new_status):
+        """Validate a transition and apply it in memory without saving"""
         if not self.can_transition_to(new_status):
             raise ValueError(f"Invalid transition from '{self.status}' to '{new_status}'")
         
@@ -127,10 +129,9 @@ class Request(models.Model):
                 # Resubmission after revision - reset approval state
                 self.last_approver = None
                 self.approval_level = 0
-        
-        self.save()
-        
-        # Log the transition
+    
+    def _build_history(self, new_status, user, notes, chain=None):
+        """Build the unsaved ApprovalHistory entry for a transition"""
         action_map = {
             'pending': 'submitted',
             'in_review': 'approved',
@@ -143,19 +144,68 @@ class Request(models.Model):
             'completed': 'completed',
         }
         
-        ApprovalHistory.objects.create(
+        return ApprovalHistory(
             request=self,
             user=user,
             action=action_map.get(new_status, new_status),
-            level=self.get_approval_level(user),
+            level=self.get_approval_level(user, chain),
             notes=notes
         )
+    
+    def transition_to(self, new_status, user, notes="", log_history=True):
+        """
+        Safely transition to new status with validation.
+        
+        Pass log_history=False to skip the ApprovalHistory entry, e.g. when a
+        caller only needs the request in a given state.
+        """
+        self._apply_transition(new_status)
+        self.save()
+        
+        # Log the transition
+        if log_history:
+            self._build_history(new_status, user, notes).save()
         
         return True
     
-    def get_approval_level(self, user):
-        """Get the approval level of the user in the hierarchy"""
+    def transition_to_batch(self, steps):
+        """
+        Apply a sequence of (status, user, notes) transitions in three queries.
+        
+        Every step is validated in memory first. The approval chain is then
+        loaded once to compute each history level, the request is saved with one
+        UPDATE and the history entries are written with one bulk INSERT. If any
+        step is invalid nothing is queried or saved and the in-memory state is
+        restored.
+        """
+        original = (self.status, self.last_approver_id, self.approval_level)
+        try:
+            for new_status, user, notes in steps:
+                self._apply_transition(new_status)
+        except ValueError:
+            self.status, self.last_approver_id, self.approval_level = original
+            raise
+        
         chain = self.get_approval_chain()
+        histories = [
+            self._build_history(new_status, user, notes, chain)
+            for new_status, user, notes in steps
+        ]
+        
+        self.save(update_fields=['status', 'last_approver', 'approval_level', 'updated_at'])
+        ApprovalHistory.objects.bulk_create(histories)
+        
+        return True
+    
+    def get_approval_level(self, user, chain=None):
+        """Get the approval level of the user in the hierarchy"""
+        # The creator is never part of their own approval chain
+        if user.pk == self.created_by_id:
+            return 0
+
+        # Callers resolving several levels can pass an already loaded chain
+        if chain is None:
+            chain = self.get_approval_chain()
         try:
             return chain.index(user) + 1
         except ValueError:
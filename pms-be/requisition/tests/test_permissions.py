@@ -1,62 +1,43 @@
 from django.test import TestCase
-from django.contrib.auth.models import Group, Permission
-from django.contrib.contenttypes.models import ContentType
 from rest_framework.test import APITestCase
 from rest_framework import status
 from authentication.models import User
 from organization.models import Worksite
 from requisition.models import Request, ApprovalHistory
+from authentication.tests.factories import build_hierarchy, get_groups, get_permissions
 
 
 class RequestPermissionTests(TestCase):
     """Test permission logic for request operations"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.worksite = Worksite.objects.create(
+        cls.worksite = Worksite.objects.create(
             city="Test City",
             address="Test Address",
             country="Test Country"
         )
 
         # Create user hierarchy
-        self.ceo = User.objects.create_user(
-            username='ceo',
-            first_name='Chief',
-            last_name='Executive',
-            worksite=self.worksite,
+        cls.ceo, cls.manager, cls.employee = build_hierarchy(
+            worksite=cls.worksite,
             is_superuser=True
         )
 
-        self.manager = User.objects.create_user(
-            username='manager',
-            first_name='Middle',
-            last_name='Manager',
-            worksite=self.worksite,
-            supervisor=self.ceo
-        )
-
-        self.employee = User.objects.create_user(
-            username='employee',
-            first_name='Team',
-            last_name='Member',
-            worksite=self.worksite,
-            supervisor=self.manager
-        )
-
-        self.purchasing_agent = User.objects.create_user(
+        cls.purchasing_agent = User.objects.create_user(
             username='purchasing',
             first_name='Purchase',
             last_name='Agent',
-            worksite=self.worksite
+            worksite=cls.worksite
         )
 
         # Create purchasing group
-        self.purchasing_group, created = Group.objects.get_or_create(name='Purchasing')
-        self.purchasing_agent.groups.add(self.purchasing_group)
+        cls.purchasing_group = get_groups('Purchasing')['Purchasing']
+        cls.purchasing_agent.groups.add(cls.purchasing_group)
 
         # Create test request
-        self.request = Request.objects.create(
+        cls.request = Request.objects.create(
             item='Test Item',
             description='Test Description',
             quantity=1.0,
@@ -64,7 +45,7 @@ class RequestPermissionTests(TestCase):
             category='Test Category',
             delivery_address='Test Address',
             reason='Test Reason',
-            created_by=self.employee,
+            created_by=cls.employee,
             request_number='TEST-2024-001'
         )
 
@@ -173,51 +154,65 @@ class RequestPermissionTests(TestCase):
 class RequestAPIPermissionTests(APITestCase):
     """Test API endpoint permissions"""
 
-    def setUp(self):
+    # (user attribute, expected status) tables for the purchasing endpoints
+    QUEUE_ACCESS_CASES = (
+        ('employee', status.HTTP_403_FORBIDDEN),
+        ('supervisor', status.HTTP_403_FORBIDDEN),
+        ('admin', status.HTTP_200_OK),
+    )
+    NON_PURCHASING_CASES = (
+        ('employee', status.HTTP_403_FORBIDDEN),
+        ('supervisor', status.HTTP_403_FORBIDDEN),
+    )
+
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for API tests"""
-        self.worksite = Worksite.objects.create(
+        cls.permissions = get_permissions('view_all_requests')
+
+        cls.worksite = Worksite.objects.create(
             city="Test City",
             address="Test Address",
             country="Test Country"
         )
 
         # Create users
-        self.admin = User.objects.create_user(
+        cls.admin = User.objects.create_user(
             username='admin',
             first_name='Admin',
             last_name='User',
-            worksite=self.worksite,
+            worksite=cls.worksite,
             is_superuser=True
         )
 
-        self.supervisor = User.objects.create_user(
+        cls.supervisor = User.objects.create_user(
             username='supervisor',
             first_name='Super',
             last_name='Visor',
-            worksite=self.worksite
+            worksite=cls.worksite
         )
 
-        self.employee = User.objects.create_user(
+        cls.employee = User.objects.create_user(
             username='employee',
             first_name='Emp',
             last_name='Loyee',
-            worksite=self.worksite,
-            supervisor=self.supervisor
+            worksite=cls.worksite,
+            supervisor=cls.supervisor
         )
 
-        self.purchasing_user = User.objects.create_user(
+        cls.purchasing_user = User.objects.create_user(
             username='purchasing',
             first_name='Purchase',
             last_name='Agent',
-            worksite=self.worksite
+            worksite=cls.worksite
         )
 
         # Add to purchasing group
-        purchasing_group, created = Group.objects.get_or_create(name='Purchasing')
-        self.purchasing_user.groups.add(purchasing_group)
+        purchasing_group = get_groups('Purchasing')['Purchasing']
+        cls.purchasing_user.groups.add(purchasing_group)
 
         # Create test requests
-        self.employee_request = Request.objects.create(
+        cls.employee_request = Request.objects.create(
             item='Employee Request',
             description='Test',
             quantity=1.0,
@@ -225,11 +220,11 @@ class RequestAPIPermissionTests(APITestCase):
             category='Test',
             delivery_address='Test',
             reason='Test',
-            created_by=self.employee,
+            created_by=cls.employee,
             request_number='EMP-2024-001'
         )
 
-        self.supervisor_request = Request.objects.create(
+        cls.supervisor_request = Request.objects.create(
             item='Supervisor Request',
             description='Test',
             quantity=1.0,
@@ -237,56 +232,39 @@ class RequestAPIPermissionTests(APITestCase):
             category='Test',
             delivery_address='Test',
             reason='Test',
-            created_by=self.supervisor,
+            created_by=cls.supervisor,
             request_number='SUP-2024-001'
         )
 
+    def _assert_status_for_users(self, cases, method, url):
+        """Send the same request as each user in cases and check the status code"""
+        for user_attr, expected_status in cases:
+            with self.subTest(user=user_attr):
+                self.client.force_authenticate(user=getattr(self, user_attr))
+                response = getattr(self.client, method)(url)
+                self.assertEqual(response.status_code, expected_status)
+
     def test_user_role_info_endpoint(self):
         """Test the user role info API endpoint"""
-        # Test as employee
-        self.client.force_authenticate(user=self.employee)
-        response = self.client.get('/api/auth/users/role-info/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        data = response.json()
-        expected = {
+        role = {
             'has_subordinates': False,
             'can_purchase': False,
             'can_view_all_requests': False,
             'is_admin': False,
             'subordinate_count': 0,
         }
-        self.assertEqual(data, expected)
-
-        # Test as supervisor
-        self.client.force_authenticate(user=self.supervisor)
-        response = self.client.get('/api/auth/users/role-info/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        data = response.json()
-        expected = {
-            'has_subordinates': True,
-            'can_purchase': False,
-            'can_view_all_requests': False,
-            'is_admin': False,
-            'subordinate_count': 1,
-        }
-        self.assertEqual(data, expected)
-
-        # Test as admin
-        self.client.force_authenticate(user=self.admin)
-        response = self.client.get('/api/auth/users/role-info/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        data = response.json()
-        expected = {
-            'has_subordinates': False,
-            'can_purchase': True,
-            'can_view_all_requests': True,
-            'is_admin': True,
-            'subordinate_count': 0,
-        }
-        self.assertEqual(data, expected)
+        cases = [
+            (self.employee, role),
+            (self.supervisor, {**role, 'has_subordinates': True, 'subordinate_count': 1}),
+            (self.admin, {**role, 'can_purchase': True, 'can_view_all_requests': True, 'is_admin': True}),
+        ]
+
+        for user, expected in cases:
+            with self.subTest(user=user.username):
+                self.client.force_authenticate(user=user)
+                response = self.client.get('/api/auth/users/role-info/')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json(), expected)
 
     def test_my_requests_endpoint(self):
         """Test that users only see their own requests"""
@@ -371,19 +349,14 @@ class RequestAPIPermissionTests(APITestCase):
         self.employee_request.status = 'approved'
         self.employee_request.save()
 
-        # Regular employee should be forbidden
-        self.client.force_authenticate(user=self.employee)
-        response = self.client.get('/api/requests/purchasing-queue/')
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        url = '/api/requests/purchasing-queue/'
 
-        # Supervisor should be forbidden
-        self.client.force_authenticate(user=self.supervisor)
-        response = self.client.get('/api/requests/purchasing-queue/')
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        # Regular employees and supervisors are forbidden, admins have access
+        self._assert_status_for_users(self.QUEUE_ACCESS_CASES, 'get', url)
 
         # Purchasing user should have access
         self.client.force_authenticate(user=self.purchasing_user)
-        response = self.client.get('/api/requests/purchasing-queue/')
+        response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         data = response.json()
@@ -400,11 +373,6 @@ class RequestAPIPermissionTests(APITestCase):
         for request in requests:
             self.assertIn(request['status'], ['approved', 'purchasing'])
 
-        # Admin should have access
-        self.client.force_authenticate(user=self.admin)
-        response = self.client.get('/api/requests/purchasing-queue/')
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
     def test_purchasing_actions_permissions(self):
         """Test purchasing action endpoints (mark purchased, delivered)"""
         # Set request to approved
@@ -412,9 +380,11 @@ class RequestAPIPermissionTests(APITestCase):
         self.employee_request.save()
 
         # Test mark as purchased - should fail for regular users
-        self.client.force_authenticate(user=self.employee)
-        response = self.client.post(f'/api/requests/{self.employee_request.id}/mark-purchased/')
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self._assert_status_for_users(
+            self.NON_PURCHASING_CASES,
+            'post',
+            f'/api/requests/{self.employee_request.id}/mark-purchased/'
+        )
 
         # Should work for purchasing user
         self.client.force_authenticate(user=self.purchasing_user)
@@ -422,26 +392,20 @@ class RequestAPIPermissionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Refresh request
-        self.employee_request.refresh_from_db()
+        self.employee_request.refresh_from_db(fields=['status'])
         self.assertEqual(self.employee_request.status, 'ordered')
 
         # Test mark as delivered
         response = self.client.post(f'/api/requests/{self.employee_request.id}/mark-delivered/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        self.employee_request.refresh_from_db()
+        self.employee_request.refresh_from_db(fields=['status'])
         self.assertEqual(self.employee_request.status, 'delivered')
 
     def test_all_requests_endpoint_admin_only(self):
         """Test that all requests endpoint is admin-only"""
         # Give admin permission
-        content_type = ContentType.objects.get_for_model(Request)
-        permission, _ = Permission.objects.get_or_create(
-            codename='view_all_requests',
-            name='Can view all requests system-wide',
-            content_type=content_type,
-        )
-        self.admin.user_permissions.add(permission)
+        self.admin.user_permissions.add(self.permissions['view_all_requests'])
 
         # Regular users should see only their requests
         self.client.force_authenticate(user=self.employee)
@@ -33,11 +33,11 @@ class RequestViewSet(viewsets.ModelViewSet):
 
         # Admins can see all requests
         if user.is_superuser or user.has_perm('requisition.view_all_requests'):
-            return Request.objects.all()
+            return Request.objects.with_related()
 
         # Purchasing team needs broader visibility for procurement workflow
         if user.can_purchase():
-            return Request.objects.filter(
+            return Request.objects.with_related().filter(
                 status__in=[
                     'approved',
                     'purchasing',
@@ -48,7 +48,7 @@ class RequestViewSet(viewsets.ModelViewSet):
 
         # Regular users only see their own requests in the main list
         # Use specialized endpoints for team/approval views
-        return Request.objects.filter(
+        return Request.objects.with_related().filter(
             created_by=user
         ).order_by('-created_at')
     
@@ -420,7 +420,7 @@ class RequestViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], url_path='my-requests', url_name='my-requests')
     def my_requests(self, request):
         """Get current user's requests"""
-        user_requests = Request.objects.filter(created_by=request.user).order_by('-created_at')
+        user_requests = Request.objects.with_related().filter(created_by=request.user).order_by('-created_at')
         
         # Apply pagination
         page = self.paginate_queryset(user_requests)
@@ -437,13 +437,13 @@ class RequestViewSet(viewsets.ModelViewSet):
         """Get requests pending approval by current user"""
         # Get requests where current user is the next approver
         pending_requests = []
-        for req in Request.objects.filter(status__in=['pending', 'in_review']):
+        for req in Request.objects.with_related().filter(status__in=['pending', 'in_review']):
             if req.get_next_approver() == request.user:
                 pending_requests.append(req)
 
         # Convert to QuerySet for pagination
         request_ids = [req.id for req in pending_requests]
-        queryset = Request.objects.filter(id__in=request_ids).order_by('-created_at')
+        queryset = Request.objects.with_related().filter(id__in=request_ids).order_by('-created_at')
 
         # Apply pagination
         page = self.paginate_queryset(queryset)
@@ -468,7 +468,7 @@ class RequestViewSet(viewsets.ModelViewSet):
             return Response([])
 
         # Get all requests from subordinates
-        team_requests = Request.objects.filter(
+        team_requests = Request.objects.with_related().filter(
             created_by__in=subordinates,
             created_by__worksite=user.worksite  # Maintain worksite boundary
         ).order_by('-created_at')
@@ -519,7 +519,7 @@ class RequestViewSet(viewsets.ModelViewSet):
         ).values_list('request_id', flat=True).distinct()
 
         # Get the actual request objects
-        approved_requests = Request.objects.filter(
+        approved_requests = Request.objects.with_related().filter(
             id__in=approved_request_ids
         ).order_by('-created_at')
 
@@ -543,7 +543,7 @@ class RequestViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
         
-        purchasing_requests = Request.objects.filter(status__in=['approved', 'purchasing']).order_by('-created_at')
+        purchasing_requests = Request.objects.with_related().filter(status__in=['approved', 'purchasing']).order_by('-created_at')
         
         # Apply pagination
         page = self.paginate_queryset(purchasing_requests)
@@ -690,7 +690,7 @@ class RequestViewSet(viewsets.ModelViewSet):
         if user.has_subordinates():
             # Get requests where current user is the next approver
             pending_approvals = []
-            for req in Request.objects.filter(status__in=['pending', 'in_review']):
+            for req in Request.objects.with_related().filter(status__in=['pending', 'in_review']):
                 if req.get_next_approver() == user:
                     pending_approvals.append(req)
 